@@ -3,30 +3,29 @@ import mediapipe as mp
 import numpy as np
 import time
 import math
+import queue
+import threading
 
 class IronManApp:
-    def __init__(self):
+    def __init__(self, model_complexity=1):
         # MediaPipe Components
+        # The pip wheels already run these graphs on the TFLite XNNPACK CPU delegate
+        # (GPU delegates need the tasks API), so the model size is the main knob:
+        # model_complexity 0 = lite pose model (fastest), 1 = full, 2 = heavy.
+        self.model_complexity = model_complexity
         self.mp_holistic = mp.solutions.holistic
-        self.holistic = self.mp_holistic.Holistic(
-            min_detection_confidence=0.5, 
-            min_tracking_confidence=0.5,
-            enable_segmentation=True,
-            smooth_segmentation=True
-        )
+        # Segmentation is only consumed by HULK, so a second graph without the
+        # segmentation head serves every other frame (both built lazily).
+        self._holistic_seg = None
+        self._holistic_noseg = None
         
         # Load Assets
         self.helmet_path = "/Users/ginapark/.gemini/antigravity/brain/dd71e901-2964-44a4-8dc6-21823272dd51/uploaded_image_1768505541069.jpg"
         self.helmet_img = self._load_image_safe(self.helmet_path)
         if self.helmet_img is None:
             print("Error: Could not load helmet image.")
-            self.helmet_img = np.zeros((300, 300, 3), dtype=np.uint8)
-            cv2.circle(self.helmet_img, (150, 150), 100, (0, 0, 255), -1)
-
-        if self.helmet_img is None:
-            print("Error: Could not load helmet image.")
-            self.helmet_img = np.zeros((300, 300, 3), dtype=np.uint8)
-            cv2.circle(self.helmet_img, (150, 150), 100, (0, 0, 255), -1)
+            self.helmet_img = np.zeros((300, 300, 4), dtype=np.uint8)
+            cv2.circle(self.helmet_img, (150, 150), 100, (0, 0, 255, 255), -1)
 
         # Pre-calculate Source Points for Mesh Warping (Normalized)
         # Order: [LeftEye, RightEye, Nose, Mouth, Chin, Forehead, LeftSide, RightSide]
@@ -54,6 +53,11 @@ class IronManApp:
             (0, 2, 3), (1, 2, 3)  # Eyes -> Nose -> Mouth (Central)
         ]
 
+        # Source side of the mesh is fixed: (num_tris, 2, 3) with one vertex per column,
+        # used per frame to build each triangle's destination -> source affine.
+        self.helmet_tri_idx = np.int32(self.helmet_triangles)
+        self.helmet_src_tris = self.src_helmet_points[self.helmet_tri_idx].transpose(0, 2, 1)
+
         # --- BODY SUIT ASSETS ---
         self.bodysuit_path = "/Users/ginapark/.gemini/antigravity/brain/dd71e901-2964-44a4-8dc6-21823272dd51/uploaded_image_1768931984272.png"
         self.bodysuit_img = self._load_image_safe(self.bodysuit_path)
@@ -135,6 +139,62 @@ class IronManApp:
         self.max_radius = 2000
         self.growth_speed = 30
         self.chest_center = (0, 0)
+        self._growth_mask = None
+        self._growth_mask_radius = 0
+        
+        # Once fully grown, warped overlay patches are reused while their destination
+        # points stay within this fraction of the frame size (see _warp_cache_get)
+        self.warp_cache_tol = 0.005
+        self._warp_cache = {}
+        
+        # Helmet/body-suit ROI scratch buffers, grown to the largest region seen (see _roi_buffer)
+        self._roi_bufs = {}
+        
+        # Holistic runs on a worker thread, on frames downscaled to this width.
+        # 1-slot queues: frames are dropped while the worker is busy, and only
+        # the freshest results are kept.
+        self.inference_width = 480
+        self._infer_in = queue.Queue(maxsize=1)
+        self._infer_out = queue.Queue(maxsize=1)
+        self._infer_stop = threading.Event()
+        
+        # Whole-frame buffers, (re)allocated by _ensure_buffers when the camera
+        # resolution changes so the frame loop itself never allocates.
+        # RGB buffers ping-pong so we never overwrite the one being processed.
+        self._buf_shape = None
+        self._infer_size = None
+        self._flip_buf = None
+        self._small_buf = None
+        self._rgb_bufs = [None, None]
+        self._rgb_slot = 0
+        self._output = None
+        self._mask_buf = None
+        
+        # Hulk effect buffers
+        self._user_mask_u8 = None
+        self._effect_mask = None
+        self._green_overlay = None
+        self._blend_scratch = None
+        
+        # Per-frame landmark pixel coords (filled by _cache_landmarks)
+        self._face_xy = None
+        self._pose_xy = None
+        
+        # Hand "Gauntlet" Cubes
+        # Wireframe cube as one open 16-point polyline: the front face, then the
+        # back face with its 4 connectors (retracing 3 of them). Each vertex is
+        # (x, y, on_back_face) in units of the cube's half size.
+        cube_path = np.int32([
+            [-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0], [-1, -1, 0],
+            [-1, -1, 1], [1, -1, 1], [1, -1, 0], [1, -1, 1], [1, 1, 1],
+            [1, 1, 0], [1, 1, 1], [-1, 1, 1], [-1, 1, 0], [-1, 1, 1], [-1, -1, 1]
+        ])
+        
+        # Larger cubes for joints (every 4th landmark), constant size is fine for stylized.
+        # Back face is offset by half the size for depth.
+        sizes = np.where(np.arange(21) % 4 == 0, 8, 5)[:, None, None]
+        self.hand_cube_offsets = (sizes * cube_path[None, :, :2]
+                                  + (sizes // 2) * cube_path[None, :, 2:] * np.int32([1, -1])).astype(np.int32)
         
         # 3D Rendering Camera Matrix (Approximation)
         self.focal_length = 640  # Approximate focal length
@@ -168,49 +228,6 @@ class IronManApp:
         # Just draw isometric or perspective offset vertices.
         return int(x), int(y)
 
-    def draw_cube(self, img, center, size, color=(0, 255, 255), thickness=1):
-        """Draws a wireframe cube centered at 'center' (x,y)."""
-        cx, cy = center
-        s = size
-        
-        # Define vertices relative to center
-        # Front face (closer to viewer) -> larger or shifted?
-        # Let's do a simple oblique projection or just a flat 3D wireframe.
-        
-        # Front Face Rect
-        f_tl = (cx - s, cy - s)
-        f_tr = (cx + s, cy - s)
-        f_br = (cx + s, cy + s)
-        f_bl = (cx - s, cy + s)
-        
-        # Back Face Rect (offset for depth)
-        depth_scale = 0.5
-        dx = int(s * depth_scale)
-        dy = int(s * depth_scale)
-        
-        b_tl = (cx - s + dx, cy - s - dy)
-        b_tr = (cx + s + dx, cy - s - dy)
-        b_br = (cx + s + dx, cy + s - dy)
-        b_bl = (cx - s + dx, cy + s - dy)
-        
-        # Draw Front Face
-        cv2.line(img, f_tl, f_tr, color, thickness)
-        cv2.line(img, f_tr, f_br, color, thickness)
-        cv2.line(img, f_br, f_bl, color, thickness)
-        cv2.line(img, f_bl, f_tl, color, thickness)
-        
-        # Draw Back Face
-        cv2.line(img, b_tl, b_tr, color, thickness)
-        cv2.line(img, b_tr, b_br, color, thickness)
-        cv2.line(img, b_br, b_bl, color, thickness)
-        cv2.line(img, b_bl, b_tl, color, thickness)
-        
-        # Connect Faces
-        cv2.line(img, f_tl, b_tl, color, thickness)
-        cv2.line(img, f_tr, b_tr, color, thickness)
-        cv2.line(img, f_br, b_br, color, thickness)
-        cv2.line(img, f_bl, b_bl, color, thickness)
-
     def draw_3d_hands(self, frame, results):
         """Draws 3D cubes around hand landmarks."""
         h, w, _ = frame.shape
@@ -221,28 +238,110 @@ class IronManApp:
         if results.right_hand_landmarks:
             hands_list.append(results.right_hand_landmarks)
             
+        if not hands_list:
+            return
+            
+        # One cube outline per landmark: (num_hands * 21, 16, 2)
+        cubes = []
         for hand_landmarks in hands_list:
-            for i, lm in enumerate(hand_landmarks.landmark):
-                cx, cy = int(lm.x * w), int(lm.y * h)
-                
-                # Size varies slightly by depth (z) if we wanted, but constant is fine for stylized.
-                # MP z is relative info.
-                
-                # Make knuckles larger?
-                size = 5 if i % 4 != 0 else 8 # Larger for joints
-                
-                color = (0, 255, 255) # Cyan-ish
-                if i == 0: color = (0, 0, 255) # Wrist Red
-                
-                self.draw_cube(frame, (cx, cy), size, color=color, thickness=1)
+            centers = (self._lm_to_array(hand_landmarks)[:, :2] * np.float32([w, h])).astype(np.int32)
+            cubes.append(centers[:, None, :] + self.hand_cube_offsets)
+        cubes = np.concatenate(cubes)
+        
+        is_wrist = np.arange(len(cubes)) % 21 == 0
+        cv2.polylines(frame, cubes[is_wrist], False, (0, 0, 255), 1) # Wrist Red
+        cv2.polylines(frame, cubes[~is_wrist], False, (0, 255, 255), 1) # Cyan-ish
         
+    def _ensure_buffers(self, shape):
+        """Allocates every whole-frame buffer for camera frames of this shape (no-op if unchanged)."""
+        if self._buf_shape == shape:
+            return
+        self._buf_shape = shape
+        h, w, _ = shape
+        
+        scale = min(1.0, self.inference_width / w)
+        self._infer_size = (int(round(w * scale)), int(round(h * scale)))
+        sw, sh = self._infer_size
+        
+        self._flip_buf = np.empty(shape, dtype=np.uint8)
+        self._small_buf = np.empty((sh, sw, 3), dtype=np.uint8)
+        self._rgb_bufs = [np.empty((sh, sw, 3), dtype=np.uint8) for _ in range(2)]
+        self._output = np.empty(shape, dtype=np.uint8)
+        self._mask_buf = np.empty((h, w), dtype=np.float32)
+        
+        self._user_mask_u8 = np.empty((h, w), dtype=np.uint8)
+        self._effect_mask = np.empty((h, w), dtype=np.uint8)
+        self._green_overlay = np.empty(shape, dtype=np.uint8)
+        self._green_overlay[:] = (0, 200, 0) # BGR
+        self._blend_scratch = np.empty(shape, dtype=np.uint8)
+        
+        self._growth_mask = np.zeros((h, w), dtype=np.uint8)
+        self._growth_mask_radius = 0
+        self._warp_cache.clear()
+
+    def _roi_buffer(self, name, shape, dtype=np.uint8):
+        """Returns a contiguous `shape` view into the named scratch buffer, growing it if needed."""
+        size = int(np.prod(shape))
+        buf = self._roi_bufs.get(name)
+        if buf is None or buf.size < size or buf.dtype != dtype:
+            buf = self._roi_bufs[name] = np.empty(size, dtype=dtype)
+        return buf[:size].reshape(shape)
+
+    def _warp_cache_get(self, name, key):
+        """Returns the cached (bbox, patch) for `name` if the suit is fully grown and key barely moved."""
+        if self.growth_radius < self.max_radius:
+            return None
+        entry = self._warp_cache.get(name)
+        if entry is None or entry[0].shape != key.shape or np.abs(key - entry[0]).max() >= self.warp_cache_tol:
+            return None
+        return entry[1:]
+
     def _load_image_safe(self, path):
-        img = cv2.imread(path)
+        """Loads an asset as BGRA. Images without alpha treat near-black pixels as transparent."""
+        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
         if img is None:
             print(f"Error: Could not load {path}")
-            return np.zeros((300, 300, 3), dtype=np.uint8)
+            return np.zeros((300, 300, 4), dtype=np.uint8)
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        if img.shape[2] == 3:
+            # Same non-black check the compositing used to do per frame, done once here
+            _, alpha = cv2.threshold(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), 5, 255, cv2.THRESH_BINARY)
+            img = np.dstack([img, alpha])
         return img
 
+    def _warp_bbox(self, Ms, src_shape, frame_shape):
+        """Frame-clipped (x0, y0, x1, y1) covering the source image under each 3x3 warp M, or None."""
+        h, w = frame_shape[:2]
+        src_h, src_w = src_shape[:2]
+        corners = np.float32([[0, 0], [src_w, 0], [src_w, src_h], [0, src_h]])
+        
+        pts = []
+        for M in Ms:
+            if np.any(corners @ M[2, :2] + M[2, 2] <= 0):
+                # A corner lands behind the camera: cover the full frame
+                return 0, 0, w, h
+            pts.append(cv2.perspectiveTransform(corners[None], M)[0])
+            
+        x0, y0, bw, bh = cv2.boundingRect(np.concatenate(pts).clip(-1, max(w, h) + 1))
+        x1, y1 = min(x0 + bw, w), min(y0 + bh, h)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1, y1
+
+    def _alpha_composite(self, dst, fg):
+        """Blends a BGRA patch over the same-sized BGR dst (in place) using its alpha."""
+        h, w = dst.shape[:2]
+        fg_bgr = cv2.cvtColor(fg, cv2.COLOR_BGRA2BGR, dst=self._roi_buffer("blend_bgr", (h, w, 3)))
+        
+        # blendLinear normalizes by w_fg + w_bg, so raw 0..255 alpha weights work as-is
+        w_fg = self._roi_buffer("blend_w_fg", (h, w), np.float32)
+        w_bg = self._roi_buffer("blend_w_bg", (h, w), np.float32)
+        np.copyto(w_fg, fg[..., 3])
+        np.subtract(255, w_fg, out=w_bg)
+        cv2.blendLinear(fg_bgr, dst, w_fg, w_bg, dst=dst)
+
     def _get_src_face_points_for_hair(self, img):
         # Hair needs to align with top of head/face.
         # We align: Left Cheek/Temple, Right Cheek/Temple, Top of Forehead
@@ -264,17 +363,19 @@ class IronManApp:
         self.growth_radius = 0
         self.max_radius = 2000 
         
+        # Restart the incremental growth mask
+        self._growth_mask_radius = 0
+        if self._growth_mask is not None:
+            self._growth_mask.fill(0)
+        
         if center:
             self.chest_center = center
         else:
              self.chest_center = (640, 360) 
 
     def calculate_angle(self, a, b, c):
-        """Calculates angle between three points (a,b,c). b is vertex."""
-        a = np.array(a)
-        b = np.array(b)
-        c = np.array(c)
-        
+        """Calculates angle between three points (a,b,c), each an (x, y) ndarray
+        (e.g. rows of _lm_to_array). b is vertex."""
         radians = np.arctan2(c[1]-b[1], c[0]-b[0]) - np.arctan2(a[1]-b[1], a[0]-b[0])
         angle = np.abs(radians*180.0/np.pi)
         
@@ -283,17 +384,27 @@ class IronManApp:
             
         return angle
 
-    def is_finger_extended(self, hand_landmarks, finger_tip_idx, finger_pip_idx):
-        """Checks if a finger is extended (Tip above PIP in y-axis context?)."""
+    def _lm_to_array(self, landmarks):
+        """Converts landmarks to an (N, 3) float32 array of normalized (x, y, z)."""
+        lms = landmarks.landmark
+        return np.fromiter((v for l in lms for v in (l.x, l.y, l.z)), dtype=np.float32, count=3 * len(lms)).reshape(-1, 3)
+
+    def _cache_landmarks(self, results, width, height):
+        """Projects face/pose landmarks to pixel coords once per frame (None if missing)."""
+        scale = np.float32([width, height])
+        self._face_xy = self._lm_to_array(results.face_landmarks)[:, :2] * scale if results.face_landmarks else None
+        self._pose_xy = self._lm_to_array(results.pose_landmarks)[:, :2] * scale if results.pose_landmarks else None
+
+    def fingers_extended(self, hand_pts):
+        """Checks which fingers are extended (Tip above PIP in y-axis context?).
+        Returns a bool array ordered [Thumb, Index, Middle, Ring, Pinky]."""
         # Note: 'Above' depends on hand orientation.
         # Robust check: Distance from Wrist to Tip > Distance from Wrist to PIP
-        wrist = hand_landmarks.landmark[0]
-        tip = hand_landmarks.landmark[finger_tip_idx]
-        pip = hand_landmarks.landmark[finger_pip_idx]
-        
-        # Euclidean Distances
-        d_tip = math.hypot(tip.x - wrist.x, tip.y - wrist.y)
-        d_pip = math.hypot(pip.x - wrist.x, pip.y - wrist.y)
+        # Tip Indices: Thumb=4, Index=8, Middle=12, Ring=16, Pinky=20
+        # PIP Indices: Thumb=2, Index=6, Middle=10, Ring=14, Pinky=18
+        wrist = hand_pts[0]
+        d_tip = np.linalg.norm(hand_pts[[4, 8, 12, 16, 20]] - wrist, axis=1)
+        d_pip = np.linalg.norm(hand_pts[[2, 6, 10, 14, 18]] - wrist, axis=1)
         
         return d_tip > d_pip
 
@@ -310,28 +421,21 @@ class IronManApp:
             self.gesture_hold_start = None
             return
 
-        # Check Fingers
-        # Indices: Thumb=4, Index=8, Middle=12, Ring=16, Pinky=20
-        # PIP Indices: Thumb=2, Index=6, Middle=10, Ring=14, Pinky=18
-        
-        thumb_ext = self.is_finger_extended(hand_lm, 4, 2)
-        index_ext = self.is_finger_extended(hand_lm, 8, 6)
-        middle_ext = self.is_finger_extended(hand_lm, 12, 10)
-        ring_ext = self.is_finger_extended(hand_lm, 16, 14)
-        pinky_ext = self.is_finger_extended(hand_lm, 20, 18)
+        # Check Fingers: [Index, Middle, Ring, Pinky] (Thumb can be flexible)
+        fingers = self.fingers_extended(self._lm_to_array(hand_lm)[:, :2])[1:].tolist()
         
         current_gesture = "NONE"
         
         # PEACE SIGN: Index & Middle Extended, Ring & Pinky Curled
-        if index_ext and middle_ext and not ring_ext and not pinky_ext:
+        if fingers == [True, True, False, False]:
             current_gesture = "PEACE"
             
-        # FIST: All fingers curled (Thumb can be flexible)
-        elif not index_ext and not middle_ext and not ring_ext and not pinky_ext:
+        # FIST: All fingers curled
+        elif not any(fingers):
             current_gesture = "FIST"
             
         # OPEN HAND: All fingers extended (High Five)
-        elif index_ext and middle_ext and ring_ext and pinky_ext:
+        elif all(fingers):
             current_gesture = "OPEN_HAND"
 
         current_time = time.time()
@@ -360,103 +464,54 @@ class IronManApp:
         else:
             self.gesture_hold_start = None
 
-    def warp_triangle(self, img1, img2, t1, t2):
-        """
-        Warps a triangular region from img1 (src) to img2 (dst).
-        """
-        # Find bounding box for each triangle
-        r1 = cv2.boundingRect(np.float32([t1]))
-        r2 = cv2.boundingRect(np.float32([t2]))
-
-        # Offset points by left top corner of the respective rectangles
-        t1_rect = []
-        t2_rect = []
-        t2_rect_int = []
-
-        for i in range(0, 3):
-            t1_rect.append(((t1[i][0] - r1[0]), (t1[i][1] - r1[1])))
-            t2_rect.append(((t2[i][0] - r2[0]), (t2[i][1] - r2[1])))
-            t2_rect_int.append(((t2[i][0] - r2[0]), (t2[i][1] - r2[1])))
-
-        # Get mask by filling triangle
-        mask = np.zeros((r2[3], r2[2], 3), dtype=np.float32)
-        cv2.fillConvexPoly(mask, np.int32(t2_rect_int), (1.0, 1.0, 1.0), 16, 0)
-
-        # Apply warpImage to small rectangular patches
-        img1_rect = img1[r1[1]:r1[1] + r1[3], r1[0]:r1[0] + r1[2]]
-        
-        size = (r2[2], r2[3])
-        
-        # Affine Transform
-        warp_mat = cv2.getAffineTransform(np.float32(t1_rect), np.float32(t2_rect))
-        img2_rect = cv2.warpAffine(img1_rect, warp_mat, size, None, flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT_101)
-        
-        # Alpha blending
-        img2_rect = img2_rect * mask
-
-        # Copy triangular region of the rectangular patch to the output image
-        y_start = r2[1]
-        y_end = r2[1]+r2[3]
-        x_start = r2[0]
-        x_end = r2[0]+r2[2]
-        
-        if y_end > img2.shape[0]: y_end = img2.shape[0]
-        if x_end > img2.shape[1]: x_end = img2.shape[1]
-        
-        # Add to existing (Assuming img2 starts black or we just accumulate)
-        # Note: Simple addition works if triangles don't overlap or if img2 is zeroed.
-        # But for 'seams', simple replacement is better if zeroed.
-        
-        # Safe addition with bounds check
-        h_part, w_part = img2[y_start:y_end, x_start:x_end].shape[:2]
-        if h_part > 0 and w_part > 0:
-             img2[y_start:y_end, x_start:x_end] = img2[y_start:y_end, x_start:x_end] * ((1.0, 1.0, 1.0) - mask[:h_part, :w_part]) + img2_rect[:h_part, :w_part]
-
-
-    def warp_body_part(self, img_src, img_dst, src_pts, dst_pts):
-        """Perspective warp for a body part quad."""
-        M = cv2.getPerspectiveTransform(src_pts, dst_pts)
+    def warp_body_parts(self, img_src, img_dst, parts):
+        """Perspective warps body part quads [(src_pts, dst_pts), ...] into one shared canvas."""
         h, w = img_dst.shape[:2]
-        warped = cv2.warpPerspective(img_src, M, (w, h))
+        key = np.concatenate([dst_pts for _, dst_pts in parts]) / np.float32([w, h])
+        cached = self._warp_cache_get("body", key)
+        if cached is not None:
+            (bx, by, bx1, by1), canvas = cached
+            self._alpha_composite(img_dst[by:by1, bx:bx1], canvas)
+            return
         
-        # Masking: Assume simple non-black check for now
-        gray = cv2.cvtColor(warped, cv2.COLOR_BGR2GRAY)
-        _, mask = cv2.threshold(gray, 5, 255, cv2.THRESH_BINARY)
+        # The whole source image is projected, so the canvas covers each part's warped image
+        Ms = [cv2.getPerspectiveTransform(src_pts, dst_pts) for src_pts, dst_pts in parts]
+        bbox = self._warp_bbox(Ms, img_src.shape, img_dst.shape)
+        if bbox is None:
+            return
+        bx, by, bx1, by1 = bbox
+        bw, bh = bx1 - bx, by1 - by
         
-        # Composite
-        mask_inv = cv2.bitwise_not(mask)
-        img_dst[:] = cv2.bitwise_and(img_dst, img_dst, mask=mask_inv)
-        img_dst[:] = cv2.add(img_dst, cv2.bitwise_and(warped, warped, mask=mask))
-
-    def apply_body_suit(self, frame, pose_landmarks):
-        """Maps Torso and Arms using Pose Landmarks."""
-        if not pose_landmarks: return frame
+        canvas = self._roi_buffer("body", (bh, bw, 4))
+        canvas.fill(0)
+        to_canvas = np.float64([[1, 0, -bx], [0, 1, -by], [0, 0, 1]])
+        for M in Ms:
+            # Transparent border keeps what earlier parts already drew
+            cv2.warpPerspective(img_src, to_canvas @ M, (bw, bh), dst=canvas, borderMode=cv2.BORDER_TRANSPARENT)
+        self._warp_cache["body"] = (key, bbox, canvas)
         
-        h, w, _ = frame.shape
-        lm = pose_landmarks.landmark
+        self._alpha_composite(img_dst[by:by1, bx:bx1], canvas)
+
+    def apply_body_suit(self, frame, pose_xy):
+        """Maps Torso and Arms using Pose Landmarks (pixel coords, see _cache_landmarks)."""
+        if pose_xy is None: return frame
         
         # -- TORSO --
-        # 11: Left Shoulder, 12: Right Shoulder, 23: Left Hip, 24: Right Hip
-        p11 = lm[11]; p12 = lm[12]; p23 = lm[23]; p24 = lm[24]
-        
-        # Helper to get coords
-        def get_pt(lm_pt, dx=0, dy=0):
-            return [lm_pt.x * w + dx, lm_pt.y * h + dy]
-            
+        # 11: Left Shoulder, 12: Right Shoulder, 24: Right Hip, 23: Left Hip
         # Torso Quad (Expanded slightly for width)
-        dst_torso = np.float32([
-            get_pt(p11, -20, -20), # TL (Left Shoulder)
-            get_pt(p12, 20, -20),  # TR (Right Shoulder)
-            get_pt(p24, 20, 20),   # BR (Right Hip)
-            get_pt(p23, -20, 20)   # BL (Left Hip)
+        dst_torso = pose_xy[[11, 12, 24, 23]] + np.float32([
+            [-20, -20], # TL (Left Shoulder)
+            [20, -20],  # TR (Right Shoulder)
+            [20, 20],   # BR (Right Hip)
+            [-20, 20]   # BL (Left Hip)
         ])
         
         # -- ARMS --
         # Left Arm: 11->13 (Shoulder->Elbow), 13->15 (Elbow->Wrist)
         # Create quads by adding perpendicular width
         def get_limb_quad(p_start, p_end, width_scale=40):
-            x1, y1 = p_start.x * w, p_start.y * h
-            x2, y2 = p_end.x * w, p_end.y * h
+            x1, y1 = p_start
+            x2, y2 = p_end
             dx = x2 - x1; dy = y2 - y1
             dist = math.hypot(dx, dy)
             if dist == 0: return np.zeros((4,2), dtype=np.float32)
@@ -475,18 +530,19 @@ class IronManApp:
             
         # Refined Quad mapping requires precise order to match Source Pts
         # For simplicity, let's just do Torso to start safe, or map strictly.
-        self.warp_body_part(self.bodysuit_img, frame, self.src_torso_pts, dst_torso)
+        self.warp_body_parts(self.bodysuit_img, frame, [(self.src_torso_pts, dst_torso)])
         
         # TODO: Refine Arm mapping vectors (requires robust normals).
         # Warping just the torso is a HUGE visual upgrade already.
         
         return frame
 
-    def apply_helmet(self, frame, face_landmarks):
+    def apply_helmet(self, frame, face_xy):
         """
         Overlays the Iron Man helmet using Detail-Preserving Mesh Warping.
+        face_xy: Face landmarks in pixel coords (see _cache_landmarks)
         """
-        if not face_landmarks:
+        if face_xy is None:
             return frame
             
         h, w, _ = frame.shape
@@ -494,85 +550,104 @@ class IronManApp:
         # 1. Get Destination Landmarks
         # Order: [LeftEye, RightEye, Nose, Mouth, Chin, Forehead, LeftSide, RightSide]
         # MP Indices: [33, 263, 1, 13, 152, 10, 234, 454]
-        indices = [33, 263, 1, 13, 152, 10, 234, 454]
-        
-        dst_points = []
-        for idx in indices:
-            p = face_landmarks.landmark[idx]
-            dst_points.append((int(p.x * w), int(p.y * h)))
-            
-        dst_points = np.array(dst_points)
-        
-        # 2. Warp Triangles
-        warped_helmet_full = np.zeros_like(frame)
-        src_pts = self.src_helmet_points
-        
-        for tri_indices in self.helmet_triangles:
-            idx1, idx2, idx3 = tri_indices
-            
-            t1 = [src_pts[idx1], src_pts[idx2], src_pts[idx3]]
-            t2 = [dst_points[idx1], dst_points[idx2], dst_points[idx3]]
-            
-            try:
-                self.warp_triangle(self.helmet_img, warped_helmet_full, t1, t2)
-            except Exception as e:
-                # Catch singular matrix errors if triangles degenerate
-                pass
-            
-        # 3. Composite
-        helmet_gray = cv2.cvtColor(warped_helmet_full, cv2.COLOR_BGR2GRAY)
-        _, mask = cv2.threshold(helmet_gray, 5, 255, cv2.THRESH_BINARY)
-        
-        mask_inv = cv2.bitwise_not(mask)
-        bg = cv2.bitwise_and(frame, frame, mask=mask_inv)
-        fg = cv2.bitwise_and(warped_helmet_full, warped_helmet_full, mask=mask)
-        
-        return cv2.add(bg, fg)
+        dst_points = face_xy[[33, 263, 1, 13, 152, 10, 234, 454]].astype(np.int32)
+        
+        # 2. Mesh warp (reused once fully grown while the face holds still)
+        key = dst_points / np.float32([w, h])
+        cached = self._warp_cache_get("helmet", key)
+        if cached is None:
+            cached = self._warp_helmet_mesh(dst_points, w, h)
+            if cached is None:
+                return frame
+            self._warp_cache["helmet"] = (key,) + cached
+        (x0, y0, x1, y1), warped_helmet = cached
+        
+        # 3. Composite (off-mesh pixels have zero alpha)
+        self._alpha_composite(frame[y0:y1, x0:x1], warped_helmet)
+        return frame
         
-    def apply_hair(self, frame, face_landmarks):
+    def _warp_helmet_mesh(self, dst_points, w, h):
+        """Mesh-warps the helmet onto dst_points; returns the (x0, y0, x1, y1) ROI and its BGRA patch."""
+        # Rasterize triangle ids over the face ROI (255 = off-mesh)
+        x0, y0, rw, rh = cv2.boundingRect(dst_points)
+        x1, y1 = min(x0 + rw, w), min(y0 + rh, h)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        
+        rh, rw = y1 - y0, x1 - x0
+        dst_tris = dst_points[self.helmet_tri_idx] - np.int32([x0, y0])
+        tri_id = self._roi_buffer("tri_id", (rh, rw))
+        tri_id.fill(255)
+        for k, tri in enumerate(dst_tris):
+            cv2.fillConvexPoly(tri_id, tri, k)
+        
+        # Destination -> Source affine per triangle: A = S @ inv(D)
+        # Degenerate triangles (and off-mesh pixels) map outside the helmet image.
+        n = len(dst_tris)
+        D = np.ones((n, 3, 3), dtype=np.float32)
+        D[:, :2, :] = dst_tris.transpose(0, 2, 1)
+        valid = np.abs(np.linalg.det(D)) > 1e-3
+        lut = np.empty((256, 6), dtype=np.float32)
+        lut[:] = (0, 0, -1, 0, 0, -1)
+        lut[:n][valid] = (self.helmet_src_tris[valid] @ np.linalg.inv(D[valid])).reshape(-1, 6)
+        
+        # Per-pixel source coords, then one remap for the whole mesh
+        # map = a0 * x + a1 * y + a2, evaluated into the reusable ROI buffers
+        coef = np.take(lut, tri_id, axis=0, out=self._roi_buffer("coef", (rh, rw, 6), np.float32))
+        xs = np.arange(rw, dtype=np.float32)
+        ys = np.arange(rh, dtype=np.float32)[:, None]
+        tmp = self._roi_buffer("tmp", (rh, rw), np.float32)
+        maps = []
+        for c, name in ((0, "map_x"), (3, "map_y")):
+            m = np.multiply(coef[..., c], xs, out=self._roi_buffer(name, (rh, rw), np.float32))
+            m += np.multiply(coef[..., c + 1], ys, out=tmp)
+            m += coef[..., c + 2]
+            maps.append(m)
+        warped_helmet = cv2.remap(self.helmet_img, maps[0], maps[1], cv2.INTER_LINEAR,
+                                  dst=self._roi_buffer("warped", (rh, rw, 4)), borderMode=cv2.BORDER_CONSTANT)
+        return (x0, y0, x1, y1), warped_helmet
+
+    def apply_hair(self, frame, face_xy):
         """
         Overlays Black Widow hair on the head.
+        face_xy: Face landmarks in pixel coords (see _cache_landmarks)
         """
-        if not face_landmarks:
+        if face_xy is None:
             return frame
-
-        h, w, _ = frame.shape
         
         # Key Points for Hair Alignment
         # 127: Left Cheek/Temple, 356: Right Cheek/Temple, 10: Top Forehead
         # These points are more stable and define the "face area" well.
-        p1 = face_landmarks.landmark[127] 
-        p2 = face_landmarks.landmark[356]
-        p3 = face_landmarks.landmark[10] 
-        
-        dst_points = np.float32([
-            [p1.x * w, p1.y * h],
-            [p2.x * w, p2.y * h],
-            [p3.x * w, p3.y * h]
-        ])
-        
-        M = cv2.getAffineTransform(self.src_hair_points, dst_points)
-        warped_hair = cv2.warpAffine(self.hair_img, M, (w, h))
+        dst_points = face_xy[[127, 356, 10]]
         
-        # Proper alpha blending if hair img is PNG with alpha
-        # Assuming simple threshold mask for now for robustness
-        hair_gray = cv2.cvtColor(warped_hair, cv2.COLOR_BGR2GRAY)
-        _, mask = cv2.threshold(hair_gray, 5, 255, cv2.THRESH_BINARY)
-        
-        mask_inv = cv2.bitwise_not(mask)
-        bg = cv2.bitwise_and(frame, frame, mask=mask_inv)
-        fg = cv2.bitwise_and(warped_hair, warped_hair, mask=mask) # If src has color
-        
-        # If the original image was just red hair on transparent/white background,
-        # we need to make sure 'fg' has the hair color.
-        # Assuming warped_hair is correct BGR.
-        
-        return cv2.add(bg, fg)
+        h, w = frame.shape[:2]
+        key = dst_points / np.float32([w, h])
+        cached = self._warp_cache_get("hair", key)
+        if cached is not None:
+            (x0, y0, x1, y1), warped_hair = cached
+        else:
+            M = cv2.getAffineTransform(self.src_hair_points, dst_points)
+            
+            # Warp only over the region the hair image lands on
+            bbox = self._warp_bbox([np.vstack([M, [0, 0, 1]])], self.hair_img.shape, frame.shape)
+            if bbox is None:
+                return frame
+            x0, y0, x1, y1 = bbox
+            M[:, 2] -= (x0, y0)
+            warped_hair = cv2.warpAffine(self.hair_img, M, (x1 - x0, y1 - y0),
+                                         dst=self._roi_buffer("hair", (y1 - y0, x1 - x0, 4)))
+            self._warp_cache["hair"] = (key, bbox, warped_hair)
+        
+        # Alpha blend (PNG alpha, or the non-black mask derived at load time)
+        self._alpha_composite(frame[y0:y1, x0:x1], warped_hair)
+        return frame
 
-    def apply_suit(self, frame, user_mask, results=None):
+    def apply_suit(self, frame, user_mask):
         """
         Applies effect based on active_effect.
         mask: Segmentation mask of the user (0.0 - 1.0)
+        Face/pose landmarks come from the per-frame _cache_landmarks pass.
         """
         if not self.is_suit_active:
             return frame
@@ -584,50 +659,55 @@ class IronManApp:
         if self.growth_radius < self.max_radius:
             self.growth_radius += self.growth_speed
             
-        # 2. Create Growth Mask (Circle)
-        growth_mask = np.zeros((h, w), dtype=np.uint8)
-        cv2.circle(growth_mask, self.chest_center, int(self.growth_radius), 255, -1)
+        # 2. Grow the Mask (Circle): only the annulus added since last frame is drawn
+        self._ensure_buffers(frame.shape)
+        growth_mask = self._growth_mask
+        
+        r_old, r_new = self._growth_mask_radius, int(self.growth_radius)
+        if r_new > r_old:
+            if r_old == 0:
+                cv2.circle(growth_mask, self.chest_center, r_new, 255, -1)
+            else:
+                # Ring centred between both radii, +2 so it overlaps the filled area
+                cv2.circle(growth_mask, self.chest_center, (r_old + r_new) // 2, 255, r_new - r_old + 2)
+            self._growth_mask_radius = r_new
         
-        output = frame.copy()
+        output = self._output
+        np.copyto(output, frame)
         
         if self.active_effect == "HULK":
             # HULK: Use Segmentation Mask + Growth Mask
-            user_mask_binary = (user_mask > 0.5).astype(np.uint8) * 255
-            effect_mask = cv2.bitwise_and(user_mask_binary, growth_mask)
-            
-            mask_bool = effect_mask > 0
-            if np.any(mask_bool):
-                green_overlay = np.zeros_like(frame)
-                green_overlay[:] = (0, 200, 0) # BGR
-                frame_part = frame[mask_bool]
-                green_part = green_overlay[mask_bool]
+            # (the first frame(s) after switching graphs may not have a mask yet)
+            if user_mask is not None:
+                cv2.compare(user_mask, 0.5, cv2.CMP_GT, dst=self._user_mask_u8)
+                effect_mask = cv2.bitwise_and(self._user_mask_u8, growth_mask, dst=self._effect_mask)
                 
-                # Blend
-                output[mask_bool] = cv2.addWeighted(frame_part, 0.6, green_part, 0.4, 0)
+                if cv2.countNonZero(effect_mask):
+                    # Blend the whole frame once, then copy it in under the mask
+                    cv2.addWeighted(frame, 0.6, self._green_overlay, 0.4, 0, dst=self._blend_scratch)
+                    cv2.copyTo(self._blend_scratch, effect_mask, dst=output)
                 
             self.hulk_frame = output.copy()
             
         elif self.active_effect == "IRON_MAN":
             
             # IRON MAN: Body Suit + Face Helmet
-            if results and results.pose_landmarks:
-                frame = self.apply_body_suit(frame, results.pose_landmarks)
+            if self._pose_xy is not None:
+                frame = self.apply_body_suit(frame, self._pose_xy)
             
             # Helmet overlay on top
-            if results and results.face_landmarks:
-                helmet_frame = self.apply_helmet(frame, results.face_landmarks)
+            if self._face_xy is not None:
+                helmet_frame = self.apply_helmet(frame, self._face_xy)
                 
                 # Apply Nanotech Growth Wipe
-                grow_bool = growth_mask > 0
-                output[grow_bool] = helmet_frame[grow_bool]
+                cv2.copyTo(helmet_frame, growth_mask, dst=output)
             
             self.ironman_frame = output.copy()
             
         elif self.active_effect == "BLACK_WIDOW":
-            if results and results.face_landmarks:
-                hair_frame = self.apply_hair(frame, results.face_landmarks)
-                grow_bool = growth_mask > 0
-                output[grow_bool] = hair_frame[grow_bool]
+            if self._face_xy is not None:
+                hair_frame = self.apply_hair(frame, self._face_xy)
+                cv2.copyTo(hair_frame, growth_mask, dst=output)
                 
             self.widow_frame = output.copy()
         
@@ -641,35 +721,59 @@ class IronManApp:
         print("3. OPEN HAND ✋ -> BLACK_WIDOW 🕷️")
         print("Press 'q' to quit.")
         
+        results = None
+        mask = None
+        
+        self._infer_stop.clear()
+        worker = threading.Thread(target=self._inference_worker, daemon=True)
+        worker.start()
+        
         while cap.isOpened():
-            ret, frame = cap.read()
+            ret, raw = cap.read()
             if not ret: break
             
-            frame = cv2.flip(frame, 1)
+            self._ensure_buffers(raw.shape)
+            frame = cv2.flip(raw, 1, dst=self._flip_buf)
             h, w, _ = frame.shape
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Process Holistic
-            results = self.holistic.process(rgb_frame)
-            
-            # Detect Gestures (using Hands + Pose info)
-            self.detect_gesture(results, w, h)
-            
-            # Determine Mask
-            mask = None
-            if results.segmentation_mask is not None:
-                 # Holistic provides segmentation too!
-                 mask = results.segmentation_mask
-                 
-            # Apply Suit/Effect
-            if self.is_suit_active:
-                # Pass full results for face landmarks
-                frame = self.apply_suit(frame, mask, results=results)
-            
-            # Draw 3D Hand "Gauntlets" always or only when active? 
-            # User asked to "wrap something around my hand nodes", usually implies always or for effect.
-            # I'll enable it generally for now to show the user the effect.
-            self.draw_3d_hands(frame, results)
+            
+            # Hand the worker a downscaled copy whenever it is idle.
+            # Landmarks are normalized, so they apply to the full-res frame as-is.
+            if self._infer_in.empty():
+                small = frame
+                if self._infer_size != (w, h):
+                    small = cv2.resize(frame, self._infer_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+                slot = self._rgb_slot
+                rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_bufs[slot])
+                with_segmentation = self.is_suit_active and self.active_effect == "HULK"
+                self._infer_in.put_nowait((rgb_frame, with_segmentation))
+                self._rgb_slot ^= 1
+            
+            # Render against the latest available results
+            try:
+                results = self._infer_out.get_nowait()
+                self._cache_landmarks(results, w, h)
+                
+                # Determine Mask
+                mask = None
+                if results.segmentation_mask is not None:
+                     # Holistic provides segmentation too! (at inference resolution)
+                     mask = cv2.resize(results.segmentation_mask, (w, h), dst=self._mask_buf,
+                                       interpolation=cv2.INTER_LINEAR)
+            except queue.Empty:
+                pass
+            
+            if results is not None:
+                # Detect Gestures (using Hands + Pose info)
+                self.detect_gesture(results, w, h)
+                     
+                # Apply Suit/Effect
+                if self.is_suit_active:
+                    frame = self.apply_suit(frame, mask)
+                
+                # Draw 3D Hand "Gauntlets" always or only when active? 
+                # User asked to "wrap something around my hand nodes", usually implies always or for effect.
+                # I'll enable it generally for now to show the user the effect.
+                self.draw_3d_hands(frame, results)
                 
             # Info
             status = f"ACTIVE: {self.active_effect}" if self.is_suit_active else "READY"
@@ -680,11 +784,53 @@ class IronManApp:
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
                 
+        self._infer_stop.set()
+        worker.join(timeout=1.0)
+        
         cap.release()
         cv2.destroyAllWindows()
         
         self.generate_avengers_montage()
 
+    def _get_holistic(self, with_segmentation):
+        """Returns the Holistic graph with/without the segmentation head, creating it on first use."""
+        if with_segmentation:
+            if self._holistic_seg is None:
+                self._holistic_seg = self.mp_holistic.Holistic(
+                    model_complexity=self.model_complexity,
+                    min_detection_confidence=0.5, 
+                    min_tracking_confidence=0.5,
+                    enable_segmentation=True,
+                    smooth_segmentation=True
+                )
+            return self._holistic_seg
+            
+        if self._holistic_noseg is None:
+            self._holistic_noseg = self.mp_holistic.Holistic(
+                model_complexity=self.model_complexity,
+                min_detection_confidence=0.5, 
+                min_tracking_confidence=0.5,
+                enable_segmentation=False
+            )
+        return self._holistic_noseg
+
+    def _inference_worker(self):
+        """Runs Holistic on frames from _infer_in, publishing the latest results to _infer_out."""
+        while not self._infer_stop.is_set():
+            try:
+                rgb_frame, with_segmentation = self._infer_in.get(timeout=0.1)
+            except queue.Empty:
+                continue
+                
+            results = self._get_holistic(with_segmentation).process(rgb_frame)
+            
+            # Replace any results the main loop hasn't picked up yet
+            try:
+                self._infer_out.get_nowait()
+            except queue.Empty:
+                pass
+            self._infer_out.put_nowait(results)
+
     def generate_avengers_montage(self):
         """Displays the Avengers Montage if all effects were used."""
         frames = []
@@ -704,18 +850,20 @@ class IronManApp:
                 h, w, _ = f.shape
                 aspect = w / h
                 new_w = int(target_h * aspect)
-                resized_frames.append(cv2.resize(f, (new_w, target_h)))
+                if (new_w, target_h) != (w, h):
+                    f = cv2.resize(f, (new_w, target_h))
+                # hconcat needs one dtype across all frames
+                resized_frames.append(f.astype(np.uint8, copy=False))
                 
             # 2. Concatenate
-            montage = np.hstack(resized_frames)
+            montage = cv2.hconcat(resized_frames)
             
             # 3. Add Title
             mh, mw, _ = montage.shape
             
-            # Black bar at top for text
+            # Black bar at top for text (allocated and filled in one pass)
             bar_h = 100
-            final_img = np.zeros((mh + bar_h, mw, 3), dtype=np.uint8)
-            final_img[bar_h:, :] = montage
+            final_img = cv2.copyMakeBorder(montage, bar_h, 0, 0, 0, cv2.BORDER_CONSTANT, value=(0, 0, 0))
             
             # Text 'AVENGERS' centered
             text = "AVENGERS"
@@ -2,6 +2,24 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import math
+from collections import OrderedDict
+
+# Pose landmark indices used by the gesture check, as plain ints for numpy indexing
+_PL = mp.solutions.pose.PoseLandmark
+LEFT_SHOULDER, RIGHT_SHOULDER = int(_PL.LEFT_SHOULDER), int(_PL.RIGHT_SHOULDER)
+LEFT_ELBOW, RIGHT_ELBOW = int(_PL.LEFT_ELBOW), int(_PL.RIGHT_ELBOW)
+LEFT_WRIST, RIGHT_WRIST = int(_PL.LEFT_WRIST), int(_PL.RIGHT_WRIST)
+# Each wrist paired with the opposite shoulder: (right wrist, left shoulder), (left wrist, right shoulder)
+CROSS_WRISTS = [RIGHT_WRIST, LEFT_WRIST]
+CROSS_SHOULDERS = [LEFT_SHOULDER, RIGHT_SHOULDER]
+
+def landmarks_xy(landmarks):
+    """Returns pose landmarks as an (N, 2) float32 array of normalized (x, y)."""
+    lms = landmarks.landmark
+    xy = np.empty((len(lms), 2), dtype=np.float32)
+    for i, l in enumerate(lms):
+        xy[i] = l.x, l.y
+    return xy
 
 class ShieldApp:
     def __init__(self):
@@ -39,44 +57,101 @@ class ShieldApp:
                 
                 # Apply mask to alpha channel
                 self.shield_img[:, :, 3] = mask
+        
+        # Blend-ready resized + rotated shields, built lazily per (size bucket, angle bucket).
+        # LRU bounded by bytes: roughly every angle of the sizes currently in use.
+        self.size_step = 16 # px
+        self.angle_step = 5 # degrees
+        self.rotation_cache = OrderedDict()
+        self.rotation_cache_max_bytes = 64 * 1024 * 1024
+        self._rotation_cache_bytes = 0
+        self._M = np.empty((2, 3), dtype=np.float64) # rotation matrix scratch
+        
+        # Pose runs on frames downscaled to this width; landmarks are normalized,
+        # so they apply to the full-res frame unchanged.
+        self.inference_width = 640
+        
+        # Per-frame buffers, allocated by cv2 on first use and reused as dst after
+        self._flip_buf = None
+        self._small_buf = None
+        self._rgb_buf = None
+
+    def _get_shield_sprite(self, shield_size, rotation_angle):
+        """
+        Returns the shield resized/rotated to the nearest cached size and angle bucket, as
+        (sprite, (dx, dy)): uint8 BGRA with the colour premultiplied by alpha, and the
+        sprite's top-left corner relative to the shield center.
+        """
+        size_bucket = max(1, int(round(shield_size / self.size_step)))
+        angle_bucket = int(round(rotation_angle / self.angle_step)) % (360 // self.angle_step)
+        key = (size_bucket, angle_bucket)
+        
+        sprite = self.rotation_cache.get(key)
+        if sprite is not None:
+            self.rotation_cache.move_to_end(key)
+        else:
+            size = size_bucket * self.size_step
+            shield_resized = cv2.resize(self.shield_img, (size, size))
+            
+            # Rotate onto a canvas big enough for the corners at 45 degrees,
+            # then keep only the part with any alpha
+            padded = int(math.ceil(size * math.sqrt(2)))
+            
+            # getRotationMatrix2D about the shield center, in closed form,
+            # plus the shift that centers the shield on the padded canvas
+            theta = math.radians(angle_bucket * self.angle_step)
+            c, s = math.cos(theta), math.sin(theta)
+            cx = cy = size // 2
+            pad = (padded - size) // 2
+            M = self._M
+            M[0] = (c, s, (1 - c) * cx - s * cy + pad)
+            M[1] = (-s, c, s * cx + (1 - c) * cy + pad)
+            rotated = cv2.warpAffine(shield_resized, M, (padded, padded), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(0,0,0,0))
+            bx, by, bw, bh = cv2.boundingRect(rotated[:, :, 3])
+            rotated = rotated[by:by + bh, bx:bx + bw]
+            
+            # Premultiply in place, rounding (255 * 255 still fits in uint16)
+            rgb = rotated[:, :, :3]
+            premul = rgb * rotated[:, :, 3:].astype(np.uint16)
+            premul += 127
+            premul //= 255
+            rgb[:] = premul
+            sprite = (rotated, (bx - padded // 2, by - padded // 2))
+            
+            # Evict least recently used sprites until the new one fits
+            while self.rotation_cache and self._rotation_cache_bytes + rotated.nbytes > self.rotation_cache_max_bytes:
+                _, (old, _) = self.rotation_cache.popitem(last=False)
+                self._rotation_cache_bytes -= old.nbytes
+            self.rotation_cache[key] = sprite
+            self._rotation_cache_bytes += rotated.nbytes
+        return sprite
 
-    def detect_gesture(self, landmarks):
+    def detect_gesture(self, pts):
         """
         Detects if an arm is crossing the chest to summon the shield.
-        Returns: ('left' or 'right', keypoints) or (None, None)
+        pts: (N, 2) normalized landmark coords (see landmarks_xy)
+        Returns: ('left' or 'right', (elbow, wrist) coords) or (None, None)
         """
-        # Landmarks
-        left_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-        left_elbow = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_ELBOW]
-        right_elbow = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_ELBOW]
-        left_wrist = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_WRIST]
-        right_wrist = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_WRIST]
-        
-        # Check Right Arm crossing to Left Side
-        # "Crossing" means Right Wrist is close to Left Shoulder
-        # Dist calculation (simple 2D euclidean on normalized coords)
+        # "Crossing" means a wrist is close to the opposite shoulder:
+        # Right Wrist near Left Shoulder/Chest, or Left Wrist near Right Shoulder.
+        # Dist calculation (simple 2D euclidean on normalized coords), both arms at once
         # Note: aspect ratio matters for true distance, but rough check is fine
-        
-        # Cross Pose: Right Wrist near Left Shoulder/Chest
-        rw_to_ls_dist = math.hypot(right_wrist.x - left_shoulder.x, right_wrist.y - left_shoulder.y)
-        
-        # Check Left Arm crossing to Right Side
-        lw_to_rs_dist = math.hypot(left_wrist.x - right_shoulder.x, left_wrist.y - right_shoulder.y)
+        d = pts[CROSS_WRISTS] - pts[CROSS_SHOULDERS]
+        rw_to_ls_dist, lw_to_rs_dist = np.hypot(d[:, 0], d[:, 1])
         
         threshold = 0.25 # Sensitivity
         
         if rw_to_ls_dist < threshold:
-            return 'right_arm', (right_elbow, right_wrist)
+            return 'right_arm', (pts[RIGHT_ELBOW], pts[RIGHT_WRIST])
         elif lw_to_rs_dist < threshold:
-            return 'left_arm', (left_elbow, left_wrist)
+            return 'left_arm', (pts[LEFT_ELBOW], pts[LEFT_WRIST])
             
         return None, None
 
     def overlay_shield(self, frame, arm_keypoints, shoulders_width_px):
         """
         Overlays the shield on the forearm.
-        arm_keypoints: (elbow, wrist) landmarks
+        arm_keypoints: (elbow, wrist) normalized coords
         """
         if not arm_keypoints:
             return frame
@@ -85,8 +160,8 @@ class ShieldApp:
         h, w, _ = frame.shape
         
         # Convert to pixels
-        el_px = np.array([elbow.x * w, elbow.y * h])
-        wr_px = np.array([wrist.x * w, wrist.y * h])
+        el_px = elbow * (w, h)
+        wr_px = wrist * (w, h)
         
         # 1. Position: Center of forearm
         center = (el_px + wr_px) / 2
@@ -111,23 +186,18 @@ class ShieldApp:
         # Actually star orientation matters. Let's rotate so 'up' aligns with forearm.
         rotation_angle = -angle - 90 # Adjust based on image native orientation
         
-        # Resize Shield
-        # Resize to square
+        # Resize + Rotate Shield (cached per size/angle bucket)
         try:
-            shield_resized = cv2.resize(self.shield_img, (shield_size, shield_size))
+            sprite, (dx, dy) = self._get_shield_sprite(shield_size, rotation_angle)
         except:
              return frame
-            
-        # Rotate Shield
-        M = cv2.getRotationMatrix2D((shield_size//2, shield_size//2), rotation_angle, 1.0)
-        shield_rotated = cv2.warpAffine(shield_resized, M, (shield_size, shield_size), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(0,0,0,0))
         
         # Overlay with Alpha
         # ROI on frame
-        x1 = int(center[0] - shield_size // 2)
-        y1 = int(center[1] - shield_size // 2)
-        x2 = x1 + shield_size
-        y2 = y1 + shield_size
+        x1 = int(center[0]) + dx
+        y1 = int(center[1]) + dy
+        x2 = x1 + sprite.shape[1]
+        y2 = y1 + sprite.shape[0]
         
         # Clip
         x1_c = max(0, x1)
@@ -144,44 +214,51 @@ class ShieldApp:
         if sp_x2 <= sp_x1 or sp_y2 <= sp_y1:
             return frame
             
-        sprite_crop = shield_rotated[sp_y1:sp_y2, sp_x1:sp_x2]
+        sprite_crop = sprite[sp_y1:sp_y2, sp_x1:sp_x2]
         frame_crop = frame[y1_c:y2_c, x1_c:x2_c]
         
-        # Blend
-        alpha = sprite_crop[:, :, 3] / 255.0
-        alpha_3d = np.stack((alpha,) * 3, axis=-1)
-        
-        bg = frame_crop * (1.0 - alpha_3d)
-        fg = sprite_crop[:, :, :3] * alpha_3d
+        # Blend in uint16 (255 * 255 still fits), alpha broadcasts over the channels:
+        # bg * (255 - a) / 255 + fg, with fg already premultiplied by a
+        blend = frame_crop * (255 - sprite_crop[:, :, 3:].astype(np.uint16))
+        blend += 127 # round
+        blend //= 255
+        blend += sprite_crop[:, :, :3]
+        np.minimum(blend, 255, out=blend) # both terms round up, so clamp
         
-        frame[y1_c:y2_c, x1_c:x2_c] = (bg + fg).astype(np.uint8)
+        frame_crop[:] = blend
         
         return frame
 
     def run(self):
         cap = cv2.VideoCapture(0)
+        # Only ever read the newest frame instead of a queue of stale ones
+        if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: Camera backend ignores CAP_PROP_BUFFERSIZE; frames may lag.")
         print("Shield App Started. Press 'q' to quit.")
         
         while cap.isOpened():
-            ret, frame = cap.read()
+            ret, raw = cap.read()
             if not ret: break
             
-            frame = cv2.flip(frame, 1)
+            frame = self._flip_buf = cv2.flip(raw, 1, dst=self._flip_buf)
             h, w, _ = frame.shape
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            small = frame
+            if w > self.inference_width:
+                small_size = (self.inference_width, int(round(h * self.inference_width / w)))
+                small = self._small_buf = cv2.resize(frame, small_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            rgb_frame = self._rgb_buf = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
             
             results = self.pose.process(rgb_frame)
             
             if results.pose_landmarks:
-                landmarks = results.pose_landmarks
+                pts = landmarks_xy(results.pose_landmarks)
                 
                 # Get scale reference
-                ls = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-                rs = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-                shoulders_width = math.hypot((ls.x - rs.x)*w, (ls.y - rs.y)*h)
+                dx, dy = (pts[LEFT_SHOULDER] - pts[RIGHT_SHOULDER]) * (w, h)
+                shoulders_width = math.hypot(dx, dy)
                 
                 # Detect
-                detected_arm, keypoints = self.detect_gesture(landmarks)
+                detected_arm, keypoints = self.detect_gesture(pts)
                 
                 if detected_arm:
                     # Overlay
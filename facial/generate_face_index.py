@@ -16,11 +16,14 @@ def main():
     files = []
     print(f"Scanning {target_dir}...")
     
-    for f in os.listdir(target_dir):
-        ext = os.path.splitext(f)[1].lower()
-        if ext in valid_exts:
-            files.append(f)
-            print(f"  Found: {f}")
+    # One scandir pass; DirEntry names need no extra path work per file
+    with os.scandir(target_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind('.')
+            # dot > 0: like splitext, a leading dot ('.png') is not an extension
+            if dot > 0 and name[dot:].lower() in valid_exts and entry.is_file():
+                files.append(name)
             
     with open(output_file, 'w') as f:
         json.dump(files, f, indent=2)
@@ -24,6 +24,9 @@ class Effects:
         
         # Landing state
         self.is_landing = False
+        
+        # Output of _compose_transition_frame, reused every transition frame
+        self._compose_out = np.empty((self.height, self.width, 3), dtype=np.uint8)
 
     def _load_and_prep_texture(self, path, is_sky=True):
         """Loads image and resizes/tiles it to match required dimensions."""
@@ -59,13 +62,11 @@ class Effects:
         sky = np.zeros((height, width, 3), dtype=np.uint8)
         
         # Gradient: Dark blue at top to lighter blue
-        for y in range(height):
-            # RGB values
-            ratio = y / height
-            r = int(135 * ratio + 0 * (1 - ratio))
-            g = int(206 * ratio + 100 * (1 - ratio))
-            b = int(235 * ratio + 180 * (1 - ratio))
-            sky[y, :] = (b, g, r) # BGR
+        # One BGR colour per row, (height, 1, 3), broadcast across the width
+        ratio = (np.arange(height) / height)[:, None, None]
+        top = np.array([180, 100, 0])    # BGR
+        bottom = np.array([235, 206, 135]) # BGR
+        sky[:] = bottom * ratio + top * (1 - ratio)
             
         # Add some random 'clouds' (white ellipses)
         num_clouds = 20
@@ -77,7 +78,8 @@ class Effects:
             cv2.ellipse(sky, center, axes, angle, 0, 360, color, -1)
             
         # Blur to make clouds soft
-        sky = cv2.GaussianBlur(sky, (51, 51), 0)
+        # (stack blur, sized to match a 51x51 Gaussian's sigma at a fraction of the cost)
+        sky = cv2.stackBlur(sky, (41, 41))
         
         return sky
 
@@ -132,7 +134,11 @@ class Effects:
             
     def _compose_transition_frame(self, offset):
         """Helper to compose Ground/Sky based on offset (0 = Ground, Height = Sky)"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # Ground and sky together cover every row for offset >= 0, so the
+        # reused buffer only needs clearing for an out-of-range offset.
+        frame = self._compose_out
+        if offset < 0:
+            frame.fill(0)
             
         # Ground part (Lower part of screen moves DOWN as offset increases)
         # Offset 0: Ground at top? No.
@@ -178,15 +184,22 @@ class Effects:
         """
         Applies a vertical motion blur to simulate speed.
         """
-        kernel = np.zeros((kernel_size, kernel_size))
-        kernel[:, int((kernel_size - 1)/2)] = np.ones(kernel_size)
-        kernel /= kernel_size
-        return cv2.filter2D(frame, -1, kernel)
+        # 1 px wide, kernel_size tall box: a plain vertical average
+        return cv2.boxFilter(frame, -1, (1, kernel_size), normalize=True)
     
     def set_sprite(self, sprite_rgb, sprite_mask):
-        """Stores the captured user sprite and its mask."""
+        """Stores the captured user sprite and its uint8 (0-255) mask."""
+        # Backgrounds are always width x height, so match the sprite to them once here
+        if sprite_rgb.shape[:2] != (self.height, self.width):
+            sprite_rgb = cv2.resize(sprite_rgb, (self.width, self.height), interpolation=cv2.INTER_AREA)
+            sprite_mask = cv2.resize(sprite_mask, (self.width, self.height), interpolation=cv2.INTER_AREA)
         self.sprite_rgb = sprite_rgb
         self.sprite_mask = sprite_mask
+        
+        # Per-pixel blend weights for cv2.blendLinear, computed once per capture
+        # (sprite_rgb may not be pre-masked perfectly, so the mask is applied here)
+        self.sprite_weights = sprite_mask.astype(np.float32) * (1.0 / 255)
+        self.sprite_inv_weights = 1.0 - self.sprite_weights
 
     def overlay_sprite(self, background):
         """Overlays the stored sprite onto the background."""
@@ -200,18 +213,6 @@ class Effects:
         # For now, static overlay.
         
         # Alpha blend
-        # background * (1 - mask) + sprite * mask
+        # background * (1 - mask) + sprite * mask, straight on uint8 (weights from set_sprite)
         # Note: sprite_rgb already has background pixels blacked out, but alpha logic is safer
-        
-        # Ensure shapes match
-        if background.shape != self.sprite_rgb.shape:
-             background = cv2.resize(background, (self.sprite_rgb.shape[1], self.sprite_rgb.shape[0]))
-             
-        bg_part = background * (1.0 - self.sprite_mask)
-        sprite_part = self.sprite_rgb # Assumes pre-masked, or use self.sprite_rgb * self.sprite_mask
-        
-        # If sprite_rgb wasn't pre-masked perfectly, using mask again is safer
-        sprite_part = self.sprite_rgb * self.sprite_mask 
-        
-        output = bg_part + sprite_part
-        return output.astype(np.uint8)
+        return cv2.blendLinear(self.sprite_rgb, background, self.sprite_weights, self.sprite_inv_weights)
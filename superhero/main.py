@@ -1,11 +1,100 @@
 import cv2
 import time
-import numpy as np
+import queue
+import threading
 import sys
 from camera2.pose_detector import PoseDetector
 from camera2.segmentation import Segmentor
 from camera2.effects import Effects
 
+# Pose detection runs on frames downscaled to this width (cost is O(H*W)).
+# Landmarks are normalized, so they apply to the full-res frame unchanged.
+INFERENCE_WIDTH = 640
+
+def put_latest(q, item, on_drop=None):
+    """
+    Puts item on a bounded queue, dropping the oldest entry instead of blocking when full.
+    on_drop, if given, is called with each dropped entry.
+    """
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                dropped = q.get_nowait()
+            except queue.Empty:
+                continue
+            if on_drop is not None and dropped is not None:
+                on_drop(dropped)
+
+def capture_frames(cap, frames_out, free_bufs, stop):
+    """
+    Capture stage: reads and mirrors frames, plus the downscaled RGB copy MediaPipe needs.
+    Each frame is written into a (frame, rgb_frame) buffer pair taken from free_bufs;
+    whichever stage finishes with (or drops) the frame puts the pair back. When no pair
+    is free the frame is skipped, so a buffer is never overwritten while still in use.
+    (cv2 allocates a buffer on first use and returns it as dst afterwards)
+    """
+    small_buf = None
+    while not stop.is_set():
+        ret, raw = cap.read()
+        if not ret:
+            print("Failed to grab frame.")
+            break
+        try:
+            flip_buf, rgb_buf = free_bufs.get_nowait()
+        except queue.Empty:
+            continue # Every buffer is still held downstream
+
+        # Flip frame horizontally for mirror view
+        frame = cv2.flip(raw, 1, dst=flip_buf)
+        
+        h, w, _ = frame.shape
+        small = frame
+        if w > INFERENCE_WIDTH:
+            small_size = (INFERENCE_WIDTH, int(round(h * INFERENCE_WIDTH / w)))
+            small = small_buf = cv2.resize(frame, small_size, dst=small_buf, interpolation=cv2.INTER_AREA)
+        rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        put_latest(frames_out, (frame, rgb_frame), free_bufs.put)
+    put_latest(frames_out, None, free_bufs.put) # End of stream
+
+def detect_poses(pose_detector, frames_in, results_out, free_bufs, stop, pose_stride):
+    """
+    Inference stage: runs pose detection and passes each frame on with its landmarks.
+    Buffer pairs of frames dropped from results_out go back to free_bufs.
+    pose_stride[0] = N detects on every Nth frame and repeats the last landmarks
+    in between (0 = no detection); main updates it as the flying state changes.
+    """
+    landmarks = None
+    count = 0
+    while not stop.is_set():
+        try:
+            item = frames_in.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is None:
+            break
+        frame, rgb_frame = item
+        stride = pose_stride[0]
+        if stride and count % stride == 0:
+            landmarks = pose_detector.detect(rgb_frame)
+        count += 1
+        put_latest(results_out, (frame, rgb_frame, landmarks), lambda dropped: free_bufs.put(dropped[:2]))
+    put_latest(results_out, None) # End of stream
+
+def capture_sprite(segmentor, frame):
+    """Segments the user out of frame, returning (sprite_rgb, sprite_mask) for Effects.set_sprite."""
+    _, mask = segmentor.remove_background(frame, background_image=None) 
+    
+    # Black out everything outside the (uint8) mask; Effects applies its alpha
+    sprite_rgb = cv2.bitwise_and(frame, frame, mask=mask)
+    return sprite_rgb, mask
+
+def precompute_sprite(segmentor, frame, pending_sprite):
+    """Background job: stores a sprite of frame in pending_sprite[0]."""
+    pending_sprite[0] = capture_sprite(segmentor, frame)
+
 def main():
     # Initialize components
     cap = cv2.VideoCapture(0)
@@ -19,6 +108,9 @@ def main():
     height = 720
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    # Keep the driver from queueing stale frames; the pipeline below buffers instead
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("Warning: Camera backend ignores CAP_PROP_BUFFERSIZE; frames may lag.")
 
     # Re-read actual width/height
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -39,19 +131,42 @@ def main():
     
     pose_start_time = None
     pose_loss_time = None
+    sprite_job = None
+    pending_sprite = [None] # (sprite_rgb, sprite_mask) segmented ahead of launch by sprite_job
+    
+    # Capture -> pose detection -> render (this thread) pipeline, so the frame
+    # rate is set by the slowest stage rather than the sum of all three.
+    frames_q = queue.Queue(maxsize=2)
+    results_q = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    # (frame, rgb_frame) buffer pairs the capture stage writes into, handed back once
+    # a frame is shown or dropped. Enough for both queues full, one frame in detection,
+    # one rendering and one being captured.
+    free_bufs = queue.Queue()
+    for _ in range(frames_q.maxsize + results_q.maxsize + 3):
+        free_bufs.put((None, None))
+    # Pose is detected every frame while grounded. While flying it only has to notice the
+    # pose being dropped (2 s grace), and landing ignores it, so detect less or not at all.
+    pose_stride = [1]
+    workers = [
+        threading.Thread(target=capture_frames, args=(cap, frames_q, free_bufs, stop), daemon=True),
+        threading.Thread(target=detect_poses, args=(pose_detector, frames_q, results_q, free_bufs, stop, pose_stride), daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
     
     while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("Failed to grab frame.")
+        try:
+            item = results_q.get(timeout=1.0)
+        except queue.Empty:
+            if not all(worker.is_alive() for worker in workers):
+                break
+            continue
+        if item is None:
             break
 
-        # Flip frame horizontally for mirror view
-        frame = cv2.flip(frame, 1)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # 1. Detect Pose
-        landmarks = pose_detector.detect(rgb_frame)
+        # 1. Pose (detected on the inference thread)
+        frame, rgb_frame, landmarks = item
         current_flying_state = pose_detector.is_superman_pose(landmarks)
         
         # State transitions with delays
@@ -65,9 +180,19 @@ def main():
                 # Counting down to start
                 if pose_start_time is None:
                     pose_start_time = current_time
+                    pending_sprite[0] = None # Drop sprites from an earlier countdown
                 elif current_time - pose_start_time > 2.0:
                     is_flying = True
                     is_landing = False
+                elif current_time - pose_start_time > 1.0:
+                    # Segment the sprite in the background during the last second of the
+                    # countdown (one job at a time) so take-off does not wait on it.
+                    # The frame is copied since the job outlives this iteration, after
+                    # which its buffer goes back to the capture stage.
+                    if sprite_job is None or not sprite_job.is_alive():
+                        sprite_job = threading.Thread(target=precompute_sprite,
+                                                      args=(segmentor, frame.copy(), pending_sprite), daemon=True)
+                        sprite_job.start()
         else:
             # User dropped pose
             pose_start_time = None # Reset start timer
@@ -88,14 +213,17 @@ def main():
             # Trigger launch if this is the first frame of flying
             if not was_flying:
                 effects.trigger_launch()
-                # Capture the body sprite!
-                _, mask = segmentor.remove_background(frame, background_image=None) 
+                # Capture the body sprite! (normally already segmented during the countdown)
+                if pending_sprite[0] is None:
+                    # Nothing ready yet: wait for the job so the segmentor is never run concurrently
+                    if sprite_job is not None:
+                        sprite_job.join()
+                    if pending_sprite[0] is None:
+                        # frame's buffer is not handed back to capture until it has been
+                        # shown, so it cannot be overwritten while this segments it
+                        pending_sprite[0] = capture_sprite(segmentor, frame)
                 
-                mask_3d = np.stack((mask,) * 3, axis=-1)
-                sprite_rgb = (frame * mask_3d).astype(np.uint8)
-                sprite_mask = mask_3d
-                
-                effects.set_sprite(sprite_rgb, sprite_mask)
+                effects.set_sprite(*pending_sprite[0])
                 
             sky_bg = effects.get_background_frame()
             output_frame = effects.overlay_sprite(sky_bg)
@@ -137,12 +265,18 @@ def main():
                         
         # Display
         cv2.imshow('Superhero Flying Effect', output_frame)
+        free_bufs.put((frame, rgb_frame)) # imshow has copied it; capture may reuse the buffers
         
         was_flying = is_flying
+        pose_stride[0] = 0 if is_landing else 3 if is_flying else 1
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=1.0)
+    
     cap.release()
     cv2.destroyAllWindows()
 
@@ -1,6 +1,12 @@
 import mediapipe as mp
 import numpy as np
 
+# Landmarks read by is_superman_pose
+_LEFT_SHOULDER = mp.solutions.pose.PoseLandmark.LEFT_SHOULDER.value
+_RIGHT_SHOULDER = mp.solutions.pose.PoseLandmark.RIGHT_SHOULDER.value
+_LEFT_WRIST = mp.solutions.pose.PoseLandmark.LEFT_WRIST.value
+_RIGHT_WRIST = mp.solutions.pose.PoseLandmark.RIGHT_WRIST.value
+
 class PoseDetector:
     def __init__(self, static_image_mode=False, model_complexity=1, smooth_landmarks=True):
         self.mp_pose = mp.solutions.pose
@@ -31,12 +37,10 @@ class PoseDetector:
             return False
 
         # Key landmarks
-        left_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_SHOULDER]
-        left_elbow = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_ELBOW]
-        right_elbow = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_ELBOW]
-        left_wrist = landmarks.landmark[self.mp_pose.PoseLandmark.LEFT_WRIST]
-        right_wrist = landmarks.landmark[self.mp_pose.PoseLandmark.RIGHT_WRIST]
+        left_shoulder = landmarks.landmark[_LEFT_SHOULDER]
+        right_shoulder = landmarks.landmark[_RIGHT_SHOULDER]
+        left_wrist = landmarks.landmark[_LEFT_WRIST]
+        right_wrist = landmarks.landmark[_RIGHT_WRIST]
 
         # Check Left Arm Superman
         # Wrist higher than shoulder (y is smaller for higher)
@@ -17,15 +17,15 @@ class Segmentor:
         background_image: (Optional) Image to replace background with. 
                           If None, returns mask.
         threshold: Segmentation confidence threshold (0.0 to 1.0)
+        Returns (output_image, mask) with mask as uint8 0-255.
         """
         results = self.segmentation.process(image)
         # Smooth the mask to reduce jitter and soften edges
-        mask = results.segmentation_mask
         # Apply a joint bilateral filter or simple blur to the mask if needed, 
         # but MediaPipe mask is already 0-1 float.
-        
-        # Expand mask to 3 channels
-        mask_3d = np.stack((mask,) * 3, axis=-1)
+        # 8 bits are plenty for compositing, so callers get the mask as uint8.
+        weights = results.segmentation_mask
+        mask = cv2.convertScaleAbs(weights, alpha=255)
         
         if background_image is None:
             bg_image = np.zeros(image.shape, dtype=np.uint8)
@@ -36,8 +36,8 @@ class Segmentor:
                 bg_image = background_image
 
         # Alpha blending
-        # output = image * mask + bg * (1 - mask)
-        output_image = image * mask_3d + bg_image * (1.0 - mask_3d)
-        output_image = output_image.astype(np.uint8)
+        # output = image * mask + bg * (1 - mask), straight on uint8 with per-pixel weights
+        # (the model's float mask is already in blendLinear's weight format)
+        output_image = cv2.blendLinear(image, bg_image, weights, 1.0 - weights)
         
         return output_image, mask